@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, scoped_session
-from os import environ
+from os import environ, getpid
 from dotenv import load_dotenv
+from threading import Lock
 
 load_dotenv()
 
@@ -11,22 +12,52 @@ PASSWORD = environ.get('DB_PASSWORD')
 DATABASE = environ.get('DB_DATABASE')
 PORT = int(environ.get('DB_PORT', 3306))
 
-engine = create_engine(
-    f"mysql+pymysql://{USER}:{PASSWORD}@{HOST}:{PORT}/{DATABASE}",
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=3600,
-    pool_pre_ping=True,
-)
+# 전체 워커의 커넥션 수가 DB_MAX_CONNECTIONS 를 넘지 않도록 워커별 풀 크기를 제한
+WORKERS = int(environ.get('WEB_CONCURRENCY', 1))
+MAX_CONNECTIONS = int(environ.get('DB_MAX_CONNECTIONS', 100))
+CONNECTIONS_PER_WORKER = max(1, MAX_CONNECTIONS // WORKERS)
+POOL_SIZE = min(int(environ.get('DB_POOL_SIZE', 5)), CONNECTIONS_PER_WORKER)
+MAX_OVERFLOW = min(int(environ.get('DB_MAX_OVERFLOW', 10)), CONNECTIONS_PER_WORKER - POOL_SIZE)
 
-SessionLocal = scoped_session(
-    sessionmaker(autocommit=False, autoflush=False, bind=engine)
-)
+# 엔진은 import 시점이 아니라 첫 사용 시점에 생성 (워커 프로세스 fork 이후 생성되도록)
+_engine = None
+_engine_pid = None
+_engine_lock = Lock()
+
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+SessionLocal = scoped_session(_session_factory)
+
+def get_engine():
+    global _engine, _engine_pid
+
+    with _engine_lock:
+        if _engine is not None and _engine_pid != getpid():
+            # 부모 프로세스에서 상속받은 커넥션은 닫지 않고 버림
+            _engine.dispose(close=False)
+            _engine = None
+
+        if _engine is None:
+            _engine = create_engine(
+                f"mysql+pymysql://{USER}:{PASSWORD}@{HOST}:{PORT}/{DATABASE}",
+                pool_size=POOL_SIZE,
+                max_overflow=MAX_OVERFLOW,
+                pool_timeout=30,
+                pool_recycle=3600,
+                pool_pre_ping=True,
+                connect_args={'connect_timeout': 5},
+            )
+            _engine_pid = getpid()
+            _session_factory.configure(bind=_engine)
+
+    return _engine
+
+def check_connection():
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
 
 def test_connection():
     try:
-        with engine.connect() as connection:
-            print("데이터베이스 연결 성공!")
+        check_connection()
+        print("데이터베이스 연결 성공!")
     except Exception as e:
         print("데이터베이스 연결 실패:", str(e))
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, Text, inspect
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
-from connectdb import engine
+from connectdb import get_engine
 
 Base = declarative_base()
 
@@ -20,15 +20,25 @@ class Meeting(Base):
 
 def create_tables():
     try:
+        engine = get_engine()
         inspector = inspect(engine)
         if "meetings" in inspector.get_table_names():
             print("테이블이 이미 존재합니다.")
-            return
+            return True
         
         Base.metadata.create_all(bind=engine)
         print("테이블 생성 완료!")
+        return True
     except Exception as e:
+        # 여러 워커가 동시에 생성을 시도한 경우 다른 워커가 이미 만든 테이블이면 성공으로 처리
+        try:
+            if "meetings" in inspect(get_engine()).get_table_names():
+                print("테이블이 이미 존재합니다.")
+                return True
+        except Exception:
+            pass
         print("테이블 생성 실패:", str(e))
+        return False
 
 if __name__ == "__main__":
     create_tables()
\ No newline at end of file
@@ -1,23 +1,36 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text
+from sqlalchemy import text, func
 from datetime import datetime
 from fastapi.middleware.cors import CORSMiddleware
+from botocore.config import Config
+from brotli_asgi import BrotliMiddleware
 
-from connectdb import SessionLocal, test_connection
+from connectdb import SessionLocal, get_engine, check_connection, test_connection
 from createtable import create_tables, Meeting
 
-import boto3, os
+import boto3, os, asyncio, hashlib
 
 ALLOWED_AUDIO_TYPES = {"audio/wav", "audio/x-wav"}
 ALLOWED_TEXT_TYPES = {"text/plain"}
 
+def warm_up():
+    test_connection()
+    if not create_tables():
+        raise RuntimeError("테이블 생성 실패")
+
+def start_warm_up():
+    # DB 연결 확인과 테이블 생성은 백그라운드에서 수행하여 서버 시작을 막지 않음
+    loop = asyncio.get_running_loop()
+    app.state.warm_up = loop.run_in_executor(None, warm_up)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    test_connection()
-    create_tables()
+    start_warm_up()
     yield
 
 app = FastAPI(lifespan=lifespan)
@@ -30,7 +43,11 @@ app.add_middleware(
     allow_headers=["*"], 
 )
 
+# JSON 응답 압축 (brotli 미지원 클라이언트는 gzip으로 응답)
+app.add_middleware(BrotliMiddleware, minimum_size=500, gzip_fallback=True)
+
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -42,10 +59,109 @@ def get_db():
     finally:
         db.close()
 
+def check_s3():
+    # boto3 기본 세션은 스레드 안전하지 않으므로 호출마다 세션을 새로 생성
+    s3 = boto3.session.Session().client(
+        's3',
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        region_name=os.getenv('AWS_DEFAULT_REGION'),
+        config=Config(connect_timeout=3, read_timeout=3, retries={'max_attempts': 1})
+    )
+    s3.head_bucket(Bucket=os.getenv('AWS_S3_BUCKET_NAME'))
+
+def get_storage_base_url():
+    return f"https://{os.getenv('AWS_S3_BUCKET_NAME')}.s3.{os.getenv('AWS_DEFAULT_REGION')}.amazonaws.com/"
+
+# 현재 버킷/리전 URL로 시작하지 않으면 키로 줄일 수 없으므로 None 반환
+def get_storage_key(url):
+    base_url = get_storage_base_url()
+    return url[len(base_url):] if url.startswith(base_url) else None
+
+# compact 모드: 키로 줄일 수 있으면 *_key, 아니면 전체 URL을 *_url 로 전달
+def add_storage_field(meeting_data, name, url):
+    key = get_storage_key(url)
+    if key is not None:
+        meeting_data[f"{name}_key"] = key
+    else:
+        meeting_data[f"{name}_url"] = url
+
+# 회의 목록 전체에 대한 ETag (최종 수정일시 + 레코드 수 + 최대 ID + 행 내용 체크섬)
+def get_meetings_etag(db: Session, compact: bool):
+    # updated_at 은 초 단위이므로 같은 초 안의 수정/삭제+추가도 구분되도록 행 내용의 CRC32 합을 함께 사용
+    row_checksum = func.crc32(func.concat_ws(
+        '|',
+        Meeting.id,
+        Meeting.company_name,
+        Meeting.meeting_name,
+        Meeting.meeting_datetime,
+        Meeting.wav_url,
+        Meeting.summary_txt_url,
+        Meeting.whole_meeting_txt_url,
+        Meeting.updated_at
+    ))
+    last_updated, count, last_id, checksum = db.query(
+        func.max(Meeting.updated_at),
+        func.count(Meeting.id),
+        func.max(Meeting.id),
+        func.sum(row_checksum)
+    ).one()
+    version = f"{last_updated.isoformat() if last_updated else ''}:{count}:{last_id}:{checksum}:{int(compact)}"
+    # 압축 미들웨어가 본문을 변환하므로 weak ETag 사용
+    return f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str):
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
 @app.get("/")
 async def root():
     return {"message": "FastAPI 서버가 실행 중입니다"}
 
+# 프로세스 생존 확인 (외부 의존성 확인 없음)
+@app.get("/health/live")
+async def liveness():
+    return {"status": "ok"}
+
+# 요청 처리 가능 여부 확인 (테이블 준비, DB, S3 연결 상태)
+@app.get("/health/ready")
+async def readiness():
+    checks = {}
+
+    warm_up_task = app.state.warm_up
+    if not warm_up_task.done():
+        checks["tables"] = "pending"
+    elif warm_up_task.exception():
+        checks["tables"] = f"error: {str(warm_up_task.exception())}"
+        # 시작 시점에 DB가 준비되지 않았던 경우를 위해 재시도
+        start_warm_up()
+    else:
+        checks["tables"] = "ok"
+
+    try:
+        await run_in_threadpool(check_connection)
+        checks["database"] = "ok"
+    except Exception as e:
+        checks["database"] = f"error: {str(e)}"
+
+    try:
+        await run_in_threadpool(check_s3)
+        checks["s3"] = "ok"
+    except Exception as e:
+        checks["s3"] = f"error: {str(e)}"
+
+    ready = all(status == "ok" for status in checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ok" if ready else "unavailable",
+            "checks": checks
+        }
+    )
+
 # 회의 정보 저장
 @app.post("/meetings/save-record/")
 async def insert_meeting_data(
@@ -204,23 +320,49 @@ async def get_meeting(meeting_id: int, db: Session = Depends(get_db)):
 
 # 모든 회의 정보 조회
 @app.get("/meetings/get-all-records/")
-async def get_all_meetings(db: Session = Depends(get_db)):
+async def get_all_meetings(
+    request: Request,
+    response: Response,
+    compact: bool = False,
+    db: Session = Depends(get_db)
+):
     try:
+        etag = get_meetings_etag(db, compact)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
         meetings = db.query(Meeting).all()
         
         meetings_list = []
         for meeting in meetings:
-            meetings_list.append({
+            meeting_data = {
                 "id": meeting.id,
                 "company_name": meeting.company_name,
                 "meeting_name": meeting.meeting_name,
-                "meeting_datetime": meeting.meeting_datetime.isoformat(),
-                "wav_url": meeting.wav_url,
-                "summary_txt_url": meeting.summary_txt_url,
-                "whole_meeting_txt_url": meeting.whole_meeting_txt_url,
-                "created_at": meeting.created_at.isoformat(),
-                "updated_at": meeting.updated_at.isoformat()
-            })
+                "meeting_datetime": meeting.meeting_datetime.isoformat()
+            }
+            if compact:
+                # URL 대신 S3 키만 전달 (storage_base_url + 키 = 전체 URL)
+                add_storage_field(meeting_data, "wav", meeting.wav_url)
+                add_storage_field(meeting_data, "summary_txt", meeting.summary_txt_url)
+                add_storage_field(meeting_data, "whole_meeting_txt", meeting.whole_meeting_txt_url)
+            else:
+                meeting_data["wav_url"] = meeting.wav_url
+                meeting_data["summary_txt_url"] = meeting.summary_txt_url
+                meeting_data["whole_meeting_txt_url"] = meeting.whole_meeting_txt_url
+            meeting_data["created_at"] = meeting.created_at.isoformat()
+            meeting_data["updated_at"] = meeting.updated_at.isoformat()
+            meetings_list.append(meeting_data)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+        if compact:
+            return {
+                "message": "회의 정보를 성공적으로 조회했습니다.",
+                "storage_base_url": get_storage_base_url(),
+                "data": meetings_list
+            }
             
         return {
             "message": "회의 정보를 성공적으로 조회했습니다.",
@@ -260,7 +402,6 @@ async def update_meeting(
         meeting.company_name = company_name
         meeting.meeting_name = meeting_name
         meeting.meeting_datetime = datetime.fromisoformat(meeting_datetime)
-        meeting.updated_at = datetime.now()
 
         db.commit()
 
@@ -384,4 +525,12 @@ async def delete_all_meetings(db: Session = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=3001, reload=True)
\ No newline at end of file
+
+    if os.getenv('SERVER_MODE') == 'production':
+        # 워커마다 별도 프로세스로 앱을 import 하므로 DB 엔진도 워커별로 생성됨
+        workers = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+        # 워커 프로세스가 커넥션 풀 크기를 계산할 수 있도록 워커 수를 전달
+        os.environ['WEB_CONCURRENCY'] = str(workers)
+        uvicorn.run("main:app", host="0.0.0.0", port=3001, workers=workers)
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=3001, reload=True)
\ No newline at end of file
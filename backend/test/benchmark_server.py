@@ -0,0 +1,78 @@
+import os, sys, time, subprocess, threading
+import urllib.request
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PORT = 3001
+BASE_URL = f"http://127.0.0.1:{PORT}"
+DURATION = 10
+CONCURRENCY = 32
+STARTUP_TIMEOUT = 60
+
+# 서버 프로세스를 띄우고 / 가 응답할 때까지 걸린 시간 측정
+def start_server(mode):
+    env = dict(os.environ, SERVER_MODE=mode)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = started + STARTUP_TIMEOUT
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{mode} 서버가 시작 중 종료되었습니다. (종료 코드: {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"{BASE_URL}/", timeout=1) as response:
+                if response.status == 200:
+                    return process, time.perf_counter() - started
+        except Exception:
+            time.sleep(0.05)
+
+    process.terminate()
+    process.wait()
+    raise RuntimeError(f"{mode} 서버가 {STARTUP_TIMEOUT}초 안에 시작되지 않았습니다.")
+
+# 지정된 시간 동안 동시 요청을 보내 초당 처리량과 실패 건수 측정
+def measure_rps(path):
+    count = 0
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + DURATION
+
+    def worker():
+        nonlocal count, errors
+        while time.perf_counter() < deadline:
+            try:
+                with urllib.request.urlopen(f"{BASE_URL}{path}", timeout=10) as response:
+                    response.read()
+                with lock:
+                    count += 1
+            except Exception:
+                with lock:
+                    errors += 1
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        futures = [executor.submit(worker) for _ in range(CONCURRENCY)]
+        for future in futures:
+            future.result()
+
+    return count / DURATION, errors
+
+for mode in ["development", "production"]:
+    process, cold_start = start_server(mode)
+    try:
+        print(f"\n=== {mode} ===")
+        print(f"콜드 스타트: {cold_start:.2f}초")
+        for path in ["/health/live", "/meetings/get-all-records/"]:
+            rps, errors = measure_rps(path)
+            print(f"{path}: {rps:.1f} req/s (실패 {errors}건)")
+    finally:
+        process.terminate()
+        process.wait()
+        time.sleep(1)
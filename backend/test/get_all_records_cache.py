@@ -0,0 +1,67 @@
+import os, sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient
+from main import app
+from dotenv import load_dotenv
+
+load_dotenv()
+
+client = TestClient(app)
+
+url = f"http://{os.getenv('API_HOST')}:{os.getenv('API_PORT')}/meetings/get-all-records/"
+
+# 1. 같은 ETag로 다시 요청하면 304
+response = client.get(url)
+etag = response.headers["ETag"]
+
+print("\n=== 조건부 요청 (If-None-Match) ===")
+print(f"ETag: {etag}")
+
+response = client.get(url, headers={"If-None-Match": etag})
+print(f"상태 코드: {response.status_code}")
+assert response.status_code == 304
+
+# 2. 회의 정보를 수정하면 ETag 변경
+record = client.get(url).json()['data'][0]
+update_url = f"http://{os.getenv('API_HOST')}:{os.getenv('API_PORT')}/meetings/update-record/{record['id']}"
+
+client.put(update_url, data={
+    "company_name": record['company_name'],
+    "meeting_name": f"{record['meeting_name']} (ETag 테스트)",
+    "meeting_datetime": record['meeting_datetime']
+})
+
+response = client.get(url, headers={"If-None-Match": etag})
+
+print("\n=== 수정 후 조건부 요청 ===")
+print(f"상태 코드: {response.status_code}")
+print(f"새 ETag: {response.headers['ETag']}")
+assert response.status_code == 200
+assert response.headers["ETag"] != etag
+
+# 원래 회의명으로 복구
+client.put(update_url, data={
+    "company_name": record['company_name'],
+    "meeting_name": record['meeting_name'],
+    "meeting_datetime": record['meeting_datetime']
+})
+
+# 3. compact 모드는 storage_base_url 과 *_key 필드 반환
+response = client.get(url, params={"compact": "true"})
+response_data = response.json()
+
+print("\n=== compact 모드 ===")
+print(f"storage_base_url: {response_data['storage_base_url']}")
+assert "storage_base_url" in response_data
+
+for record in response_data['data']:
+    print(f"\n회의 ID: {record['id']}")
+    for name in ["wav", "summary_txt", "whole_meeting_txt"]:
+        # 현재 버킷/리전 URL이 아닌 항목은 전체 URL(*_url)로 전달됨
+        assert f"{name}_key" in record or f"{name}_url" in record
+        print(f"{name}: {record.get(f'{name}_key', record.get(f'{name}_url'))}")
+
+assert any("wav_key" in record for record in response_data['data'])
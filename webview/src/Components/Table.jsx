@@ -22,8 +22,17 @@ const Table = () => {
 
   const fetchMeetings = async () => {
     try {
-      const response = await axios.get(`${import.meta.env.VITE_API_URL}/meetings/get-all-records/`);
-      setMeetings(response.data.data);
+      // compact 모드: S3 키만 받아서 전체 URL은 클라이언트에서 조합 (키로 줄일 수 없는 항목은 URL 그대로 전달됨)
+      const response = await axios.get(`${import.meta.env.VITE_API_URL}/meetings/get-all-records/`, {
+        params: { compact: true }
+      });
+      const { storage_base_url, data } = response.data;
+      setMeetings(data.map(meeting => ({
+        ...meeting,
+        wav_url: meeting.wav_url ?? `${storage_base_url}${meeting.wav_key}`,
+        summary_txt_url: meeting.summary_txt_url ?? `${storage_base_url}${meeting.summary_txt_key}`,
+        whole_meeting_txt_url: meeting.whole_meeting_txt_url ?? `${storage_base_url}${meeting.whole_meeting_txt_key}`
+      })));
       setLoading(false);
     } catch (err) {
       console.log(err);